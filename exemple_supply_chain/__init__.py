@@ -1,3 +1,9 @@
 from .data import Tache, CahierDesCharges, Intervalle
-from .algos import produit_planning
-from .visualisation import cahier_to_table, planning_to_table
+from .algos import produit_planning, iter_planning
+from .disque import lit_taches, iter_planning_disque, ecrit_planning
+from .visualisation import (
+    cahier_to_table,
+    planning_to_table,
+    planning_top_table,
+    planning_to_gantt,
+)
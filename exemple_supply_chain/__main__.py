@@ -5,10 +5,17 @@
 Interface typer pour l'ordonnancement de tâche
 """
 import sys
+from typing import Optional
 from typer import Typer
-from .visualisation import cahier_to_table, planning_to_table
+from .visualisation import (
+    cahier_to_table,
+    planning_to_table,
+    planning_top_table,
+    planning_to_gantt,
+)
 from .data import CahierDesCharges, Tache
-from .algos import produit_planning
+from .algos import produit_planning, iter_planning
+from .disque import lit_taches, iter_planning_disque, ecrit_planning
 from rich import print
 
 app = Typer()
@@ -31,8 +38,18 @@ def demo():
 
 
 @app.command()
-def view(chemin: str):
-    """Visualise un fichier json encodant un cahier des charges"""
+def view(chemin: str, page: Optional[int] = None, taille_page: int = 50):
+    """Visualise un fichier json encodant un cahier des charges
+
+    Avec --page seules les tâches de la page sont lues, sans valider l'ensemble du cahier.
+    """
+    if page is not None:
+        try:
+            print(cahier_to_table(lit_taches(chemin), page, taille_page))
+        except Exception as err:
+            print(err)
+            sys.exit(1)
+        return
     with open(chemin, "r") as fichier:
         donnees = fichier.read()
     try:
@@ -44,17 +61,60 @@ def view(chemin: str):
 
 
 @app.command()
-def solve(chemin: str):
-    """Produit un planning d'ordonnancement à partir du cahier des charges indiqué par le chemin"""
-    with open(chemin, "r") as fichier:
-        donnees = fichier.read()
+def solve(
+    chemin: str,
+    disque: bool = False,
+    sortie: Optional[str] = None,
+    gantt: bool = False,
+    top: Optional[int] = None,
+    critere: str = "duree",
+    page: Optional[int] = None,
+    taille_page: int = 50,
+):
+    """Produit un planning d'ordonnancement à partir du cahier des charges indiqué par le chemin
+
+    Avec --disque le calcul passe par une base SQLite, avec --sortie le planning est écrit en json lines.
+    Pour les gros plannings, --gantt affiche un Gantt agrégé, --top les tâches principales
+    selon --critere et --page une seule page de la table.
+    Hors --disque, --sortie, --gantt et --top consomment le planning au fil de l'eau, dans un ordre topologique.
+    Les options --sortie, --gantt, --top et --page sont exclusives, et --disque en exige une
+    pour que la mémoire reste bornée.
+    """
+    nb_options = sum([sortie is not None, gantt, top is not None, page is not None])
+    if nb_options > 1:
+        print("Les options --sortie, --gantt, --top et --page sont exclusives!")
+        sys.exit(1)
+    if disque and nb_options == 0:
+        print("L'option --disque nécessite --sortie, --gantt, --top ou --page!")
+        sys.exit(1)
+    if disque:
+        planning = iter_planning_disque(lit_taches(chemin))
+    else:
+        with open(chemin, "r") as fichier:
+            donnees = fichier.read()
+        try:
+            cahier = CahierDesCharges.model_validate_json(donnees)
+        except Exception as err:
+            print(err)
+            sys.exit(1)
+        if sortie is not None or gantt or top is not None:
+            planning = iter_planning(cahier)
+        else:
+            planning = produit_planning(cahier).items()
     try:
-        cahier = CahierDesCharges.model_validate_json(donnees)
+        if sortie is not None:
+            ecrit_planning(planning, sortie)
+        elif gantt:
+            print(planning_to_gantt(planning))
+        elif top is not None:
+            print(planning_top_table(planning, top, critere))
+        elif page is not None:
+            print(planning_to_table(planning, page, taille_page))
+        else:
+            print(planning_to_table(dict(planning)))
     except Exception as err:
         print(err)
         sys.exit(1)
-    planning = produit_planning(cahier)
-    print(planning_to_table(planning))
 
 
 if __name__ == "__main__":
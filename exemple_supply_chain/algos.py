@@ -4,6 +4,8 @@
 
 Topological sorting des Taches puis production d'un planning.
 """
+from collections import deque
+from collections.abc import Iterator
 from .data import Tache, CahierDesCharges, Intervalle
 
 
@@ -73,15 +75,61 @@ def produit_planning(cahier: CahierDesCharges) -> dict[Tache, Intervalle]:
     Returns:
         dict[Tache, Intervalle]: Un dictionnaire associant chaque tâche à un intervalle de temps.
 
+    Raises:
+        ValueError: Si le cahier des charges est insoluble, c'est-à-dire s'il contient des cycles de dépendances,
+            ou si plusieurs tâches portent le même nom.
+    """
+    resultat = {tache.nom: intervalle for tache, intervalle in iter_planning(cahier)}
+    return {tache: resultat[tache.nom] for tache in cahier.taches}
+
+
+def iter_planning(cahier: CahierDesCharges) -> Iterator[tuple[Tache, Intervalle]]:
+    """Produit le planning du cahier des charges au fil de l'eau.
+
+    Les couples (tâche, intervalle) sont émis dans un ordre topologique, dès que tous les
+    prérequis d'une tâche ont été planifiés. Seules les fins des tâches dont un successeur
+    reste à planifier sont conservées en mémoire.
+
+    Args:
+        cahier (CahierDesCharges): Le cahier des charges contenant les tâches et leurs prérequis.
+
+    Yields:
+        tuple[Tache, Intervalle]: Une tâche et son intervalle de temps.
+
     Raises:
         ValueError: Si le cahier des charges est insoluble, c'est-à-dire s'il contient des cycles de dépendances.
+            L'exception est levée une fois toutes les tâches planifiables émises.
+            Si plusieurs tâches portent le même nom, avant toute émission.
     """
-    taches_ordonnees = tri_topologique(cahier)
-    resultat = dict()
-    for tache in taches_ordonnees:
+    successeurs: dict[str, list[Tache]] = {tache.nom: [] for tache in cahier.taches}
+    if len(successeurs) != len(cahier.taches):
+        raise ValueError("Le cahier des charges contient des tâches en double!")
+    attentes = {tache.nom: len(tache.prerequis) for tache in cahier.taches}
+    for tache in cahier.taches:
+        for prerequis in tache.prerequis:
+            successeurs[prerequis].append(tache)
+    a_traiter = deque(tache for tache in cahier.taches if not tache.prerequis)
+    fins: dict[str, float] = dict()
+    restants = {nom: len(suivantes) for nom, suivantes in successeurs.items()}
+    nb_traitees = 0
+    while a_traiter:
+        tache = a_traiter.popleft()
         if tache.prerequis:
-            debut = max(resultat[prerequis].fin for prerequis in tache.prerequis)
+            debut = max(fins[prerequis] for prerequis in tache.prerequis)
         else:
             debut = 0.0
-        resultat[tache.nom] = Intervalle(debut=debut, fin=debut + tache.duree)
-    return {tache: resultat[tache.nom] for tache in cahier.taches}
+        for prerequis in tache.prerequis:
+            restants[prerequis] -= 1
+            if restants[prerequis] == 0:
+                del fins[prerequis]
+        fin = debut + tache.duree
+        if restants[tache.nom]:
+            fins[tache.nom] = fin
+        for suivante in successeurs.pop(tache.nom):
+            attentes[suivante.nom] -= 1
+            if attentes[suivante.nom] == 0:
+                a_traiter.append(suivante)
+        nb_traitees += 1
+        yield tache, Intervalle(debut=debut, fin=fin)
+    if nb_traitees != len(cahier.taches):
+        raise ValueError("Le cahier des charges est insolubles!")
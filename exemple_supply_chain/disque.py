@@ -0,0 +1,292 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Description.
+
+Ordonnancement sur disque via SQLite pour les cahiers des charges trop gros pour la mémoire.
+"""
+import json
+import sqlite3
+from collections.abc import Iterable, Iterator
+from itertools import groupby, islice
+from pathlib import Path
+from typing import Any, TextIO
+from tempfile import TemporaryDirectory
+from .data import Tache, Intervalle
+
+_BLANCS = " \t\n\r"
+# Une erreur de décodage à moins de _MARGE caractères de la fin du tampon peut venir
+# d'un littéral ou d'un nombre coupé par la lecture par blocs.
+_MARGE = 16
+
+_SCHEMA = """
+DROP TABLE IF EXISTS taches;
+DROP TABLE IF EXISTS prerequis;
+CREATE TABLE taches (
+    id INTEGER PRIMARY KEY,
+    nom TEXT NOT NULL UNIQUE,
+    duree NOT NULL,
+    attentes INTEGER NOT NULL,
+    niveau INTEGER,
+    debut REAL,
+    fin REAL
+);
+CREATE TABLE prerequis (
+    tache TEXT NOT NULL,
+    rang INTEGER NOT NULL,
+    prerequis TEXT NOT NULL
+);
+"""
+
+_INDEX = """
+CREATE INDEX taches_etat ON taches (niveau, attentes);
+CREATE INDEX prerequis_tache ON prerequis (tache, rang);
+CREATE INDEX prerequis_prerequis ON prerequis (prerequis);
+"""
+
+
+class _Tampon:
+    """Tampon de lecture par blocs d'un fichier texte."""
+
+    def __init__(self, fichier: TextIO, taille_bloc: int):
+        self.fichier = fichier
+        self.taille_bloc = taille_bloc
+        self.texte = ""
+        self.position = 0
+
+    def _lit(self) -> bool:
+        """Ajoute un bloc au tampon en oubliant le texte consommé, renvoie False en fin de fichier."""
+        bloc = self.fichier.read(self.taille_bloc)
+        self.texte = self.texte[self.position :] + bloc
+        self.position = 0
+        return bool(bloc)
+
+    def suivant(self) -> str:
+        """Renvoie le prochain caractère non blanc sans le consommer, ou "" en fin de fichier."""
+        while True:
+            while self.position < len(self.texte) and self.texte[self.position] in _BLANCS:
+                self.position += 1
+            if self.position < len(self.texte):
+                return self.texte[self.position]
+            if not self._lit():
+                return ""
+
+    def consomme(self, attendu: str) -> bool:
+        """Consomme le texte attendu s'il suit d'éventuels blancs, renvoie False sinon."""
+        self.suivant()
+        while len(self.texte) - self.position < len(attendu) and self._lit():
+            pass
+        if not self.texte.startswith(attendu, self.position):
+            return False
+        self.position += len(attendu)
+        return True
+
+    def decode(self, decodeur: json.JSONDecoder) -> Any:
+        """Décode la prochaine valeur json, en lisant de nouveaux blocs si elle est incomplète."""
+        while True:
+            try:
+                objet, self.position = decodeur.raw_decode(self.texte, self.position)
+                return objet
+            except json.JSONDecodeError as err:
+                incomplet = err.msg.startswith("Unterminated string") or (
+                    err.pos >= len(self.texte) - _MARGE
+                )
+                if not incomplet:
+                    raise ValueError(f"Tâche json invalide: {err}")
+                if not self._lit():
+                    raise ValueError("Le fichier est tronqué!")
+
+
+def lit_taches(chemin: str, taille_bloc: int = 1 << 16) -> Iterator[Tache]:
+    """Lit les tâches d'un fichier json de cahier des charges sans le charger entièrement.
+
+    Le fichier doit commencer par la clé "taches", comme ceux produits par model_dump_json.
+
+    Args:
+        chemin (str): Le chemin du fichier json encodant le cahier des charges.
+        taille_bloc (int): Le nombre de caractères lus à chaque accès au fichier.
+
+    Yields:
+        Tache: Les tâches du cahier des charges, dans l'ordre du fichier.
+
+    Raises:
+        ValueError: Si le fichier ne commence pas par une liste de tâches, contient une tâche
+            json invalide ou est tronqué.
+    """
+    decodeur = json.JSONDecoder()
+    with open(chemin, "r") as fichier:
+        tampon = _Tampon(fichier, taille_bloc)
+        for attendu in ("{", '"taches"', ":", "["):
+            if not tampon.consomme(attendu):
+                raise ValueError("Aucune liste de tâches trouvée!")
+        if tampon.consomme("]"):
+            return
+        while True:
+            caractere = tampon.suivant()
+            if caractere != "{":
+                raise ValueError(f"Tâche json invalide: objet attendu, {caractere!r} trouvé")
+            yield Tache.model_validate(tampon.decode(decodeur))
+            caractere = tampon.suivant()
+            if caractere == "]":
+                return
+            if caractere == "":
+                raise ValueError("Le fichier est tronqué!")
+            if caractere != ",":
+                raise ValueError(f"Tâche json invalide: ',' ou ']' attendu, {caractere!r} trouvé")
+            tampon.consomme(",")
+
+
+def _charge(connexion: sqlite3.Connection, taches: Iterable[Tache], taille_lot: int):
+    """Insère les tâches et leurs prérequis par lots dans la base."""
+    iterateur = iter(taches)
+    while lot := list(islice(iterateur, taille_lot)):
+        try:
+            connexion.executemany(
+                "INSERT INTO taches (nom, duree, attentes) VALUES (?, ?, ?)",
+                ((tache.nom, tache.duree, len(tache.prerequis)) for tache in lot),
+            )
+        except sqlite3.IntegrityError:
+            raise ValueError("Le cahier des charges contient des tâches en double!")
+        connexion.executemany(
+            "INSERT INTO prerequis (tache, rang, prerequis) VALUES (?, ?, ?)",
+            (
+                (tache.nom, rang, prerequis)
+                for tache in lot
+                for rang, prerequis in enumerate(tache.prerequis)
+            ),
+        )
+        connexion.commit()
+
+
+def _planifie(connexion: sqlite3.Connection):
+    """Calcule les intervalles niveau par niveau de l'ordre topologique."""
+    niveau = 0
+    while True:
+        curseur = connexion.execute(
+            "UPDATE taches SET niveau = ? WHERE niveau IS NULL AND attentes = 0",
+            (niveau,),
+        )
+        if curseur.rowcount == 0:
+            break
+        connexion.execute(
+            """
+            UPDATE taches SET debut = COALESCE(
+                (SELECT MAX(t.fin) FROM prerequis p JOIN taches t ON t.nom = p.prerequis
+                 WHERE p.tache = taches.nom),
+                0.0)
+            WHERE niveau = ?
+            """,
+            (niveau,),
+        )
+        connexion.execute(
+            "UPDATE taches SET fin = debut + duree WHERE niveau = ?", (niveau,)
+        )
+        connexion.execute(
+            """
+            UPDATE taches SET attentes = attentes - (
+                SELECT COUNT(*) FROM prerequis p JOIN taches t ON t.nom = p.prerequis
+                WHERE p.tache = taches.nom AND t.niveau = ?)
+            WHERE nom IN (
+                SELECT p.tache FROM prerequis p JOIN taches t ON t.nom = p.prerequis
+                WHERE t.niveau = ?)
+            """,
+            (niveau, niveau),
+        )
+        connexion.commit()
+        niveau += 1
+    (restantes,) = connexion.execute(
+        "SELECT COUNT(*) FROM taches WHERE niveau IS NULL"
+    ).fetchone()
+    if restantes:
+        raise ValueError("Le cahier des charges est insolubles!")
+
+
+def iter_planning_disque(
+    taches: Iterable[Tache], chemin_base: str | None = None, taille_lot: int = 10_000
+) -> Iterator[tuple[Tache, Intervalle]]:
+    """Produit un planning en passant par une base SQLite sur disque.
+
+    Les tâches sont chargées par lots, le tri topologique et le calcul des dates de début
+    sont effectués en SQL niveau par niveau, puis le planning est relu au fil de l'eau.
+    La mémoire utilisée reste bornée par la taille d'un lot.
+
+    Args:
+        taches (Iterable[Tache]): Les tâches du cahier des charges, par exemple issues de lit_taches.
+        chemin_base (str | None): Le chemin de la base SQLite, temporaire si None.
+            Les tables taches et prerequis d'une base existante sont recréées.
+        taille_lot (int): Le nombre de tâches insérées par transaction.
+
+    Yields:
+        tuple[Tache, Intervalle]: Une tâche et son intervalle, dans l'ordre des tâches fournies.
+
+    Raises:
+        ValueError: Si un prérequis n'existe pas, si une tâche est en double ou si le cahier
+            des charges contient des cycles de dépendances.
+    """
+    if chemin_base is not None:
+        yield from _iter_planning_base(taches, chemin_base, taille_lot)
+        return
+    with TemporaryDirectory() as dossier:
+        chemin_temporaire = str(Path(dossier) / "planning.sqlite")
+        yield from _iter_planning_base(taches, chemin_temporaire, taille_lot)
+
+
+def _iter_planning_base(
+    taches: Iterable[Tache], chemin_base: str, taille_lot: int
+) -> Iterator[tuple[Tache, Intervalle]]:
+    """Produit le planning des tâches dans la base SQLite indiquée, dont les tables sont recréées."""
+    connexion = sqlite3.connect(chemin_base)
+    try:
+        connexion.execute("PRAGMA journal_mode = OFF")
+        connexion.execute("PRAGMA synchronous = OFF")
+        connexion.executescript(_SCHEMA)
+        _charge(connexion, taches, taille_lot)
+        connexion.executescript(_INDEX)
+        invalide = connexion.execute(
+            """
+            SELECT p.prerequis FROM prerequis p LEFT JOIN taches t ON t.nom = p.prerequis
+            WHERE t.nom IS NULL LIMIT 1
+            """
+        ).fetchone()
+        if invalide is not None:
+            raise ValueError(f"{invalide[0]} n'est pas un prérequis valide!")
+        _planifie(connexion)
+        lignes = connexion.execute(
+            """
+            SELECT t.id, t.nom, t.duree, t.debut, t.fin, p.prerequis
+            FROM taches t LEFT JOIN prerequis p ON p.tache = t.nom
+            ORDER BY t.id, p.rang
+            """
+        )
+        for _, groupe in groupby(lignes, key=lambda ligne: ligne[0]):
+            groupe = list(groupe)
+            _, nom, duree, debut, fin, _ = groupe[0]
+            prerequis = tuple(ligne[5] for ligne in groupe if ligne[5] is not None)
+            yield (
+                Tache(nom=nom, duree=duree, prerequis=prerequis),
+                Intervalle(debut=debut, fin=fin),
+            )
+    finally:
+        connexion.close()
+
+
+def ecrit_planning(planning: Iterable[tuple[Tache, Intervalle]], chemin: str):
+    """Écrit un planning au format json lines, une tâche par ligne.
+
+    Le planning est d'abord écrit dans un fichier .tmp voisin, renommé à la fin: si le planning
+    lève une exception en cours de route, aucun fichier partiel ne subsiste.
+
+    Args:
+        planning (Iterable[tuple[Tache, Intervalle]]): Les couples tâche, intervalle à écrire.
+        chemin (str): Le chemin du fichier de sortie.
+    """
+    destination = Path(chemin)
+    temporaire = destination.with_name(destination.name + ".tmp")
+    try:
+        with open(temporaire, "w") as fichier:
+            for tache, intervalle in planning:
+                ligne = {"nom": tache.nom, "debut": intervalle.debut, "fin": intervalle.fin}
+                fichier.write(json.dumps(ligne, ensure_ascii=False) + "\n")
+    except BaseException:
+        temporaire.unlink(missing_ok=True)
+        raise
+    temporaire.replace(destination)
@@ -5,44 +5,108 @@
 Transformations de CahierDesCharges et dict[Tache, Intervalle] vers des tables rich pour affichage.
 """
 
+import heapq
+from array import array
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from math import ceil
 from .data import Tache, Intervalle, CahierDesCharges
 from rich.table import Table  # type: ignore
 
+CRITERES = {
+    "duree": lambda couple: couple[0].duree,
+    "fin": lambda couple: couple[1].fin,
+}
 
-def cahier_to_table(cahier: CahierDesCharges) -> Table:
+
+def _pagine(elements: Iterable, page: int | None, taille_page: int) -> Iterator:
+    """Restreint les éléments à la page demandée, numérotée à partir de 1."""
+    if page is None:
+        return iter(elements)
+    if page < 1 or taille_page < 1:
+        raise ValueError("La page et sa taille doivent être strictement positives!")
+    return islice(elements, (page - 1) * taille_page, page * taille_page)
+
+
+def _position(date: float, nb_fenetres: int, horizon: float) -> float:
+    """Position d'une date en nombre de fenêtres, recalée sur une frontière de fenêtre proche."""
+    position = date * nb_fenetres / horizon
+    frontiere = round(position)
+    return float(frontiere) if abs(position - frontiere) < 1e-9 else position
+
+
+def _titre(titre: str, page: int | None) -> str:
+    """Ajoute le numéro de page au titre d'une table."""
+    return titre if page is None else f"{titre} (page {page})"
+
+
+def _couples(
+    planning: dict[Tache, Intervalle] | Iterable[tuple[Tache, Intervalle]]
+) -> Iterable[tuple[Tache, Intervalle]]:
+    """Renvoie les couples tâche, intervalle d'un planning sous forme de dictionnaire ou de flux."""
+    return planning.items() if isinstance(planning, dict) else planning
+
+
+def cahier_to_table(
+    cahier: CahierDesCharges | Iterable[Tache],
+    page: int | None = None,
+    taille_page: int = 50,
+) -> Table:
     """Convertit un CahierDesCharges en une table Rich.
 
     Args:
-        cahier (CahierDesCharges): Le cahier des charges à convertir.
+        cahier (CahierDesCharges | Iterable[Tache]): Le cahier des charges ou un flux de tâches à convertir.
+        page (int | None): La page à afficher, numérotée à partir de 1, ou None pour tout afficher.
+        taille_page (int): Le nombre de tâches par page.
 
     Returns:
         Table: La table Rich correspondant au cahier des charges.
+
+    Raises:
+        ValueError: Si la page ou sa taille n'est pas strictement positive.
     """
-    resultat = Table(title="Cahier des Charges")
+    taches = cahier.taches if isinstance(cahier, CahierDesCharges) else cahier
+    resultat = Table(title=_titre("Cahier des Charges", page))
     resultat.add_column("Nom")
     resultat.add_column("Durée")
     resultat.add_column("Prérequis")
-    for tache in cahier.taches:
+    for tache in _pagine(taches, page, taille_page):
         resultat.add_row(tache.nom, f"{tache.duree:.2f}", ", ".join(tache.prerequis))
     return resultat
 
 
-def planning_to_table(planning: dict[Tache, Intervalle]) -> Table:
+def planning_to_table(
+    planning: dict[Tache, Intervalle] | Iterable[tuple[Tache, Intervalle]],
+    page: int | None = None,
+    taille_page: int = 50,
+) -> Table:
     """Convertit un dictionnaire de Tache vers Intervalle en une table Rich.
 
     Args:
-        planning (dict[Tache, Intervalle]): Le planning à convertir.
+        planning (dict[Tache, Intervalle] | Iterable[tuple[Tache, Intervalle]]): Le planning à convertir.
+        page (int | None): La page à afficher, numérotée à partir de 1, ou None pour tout afficher.
+        taille_page (int): Le nombre de tâches par page.
 
     Returns:
         Table: La table Rich correspondant au planning.
+
+    Raises:
+        ValueError: Si la page ou sa taille n'est pas strictement positive.
     """
-    resultat = Table(title="Planning")
+    return _table_planning(
+        _titre("Planning", page), _pagine(_couples(planning), page, taille_page)
+    )
+
+
+def _table_planning(titre: str, couples: Iterable[tuple[Tache, Intervalle]]) -> Table:
+    """Construit la table Rich des couples tâche, intervalle donnés."""
+    resultat = Table(title=titre)
     resultat.add_column("Nom")
     resultat.add_column("Début")
     resultat.add_column("Fin")
     resultat.add_column("Durée")
     resultat.add_column("Prérequis")
-    for tache, intervalle in planning.items():
+    for tache, intervalle in couples:
         resultat.add_row(
             tache.nom,
             f"{intervalle.debut:.2f}",
@@ -51,3 +115,109 @@ def planning_to_table(planning: dict[Tache, Intervalle]) -> Table:
             ", ".join(tache.prerequis),
         )
     return resultat
+
+
+def planning_top_table(
+    planning: dict[Tache, Intervalle] | Iterable[tuple[Tache, Intervalle]],
+    n: int = 20,
+    critere: str = "duree",
+) -> Table:
+    """Convertit les n tâches principales d'un planning en une table Rich.
+
+    Le planning n'est parcouru qu'une fois et seules n tâches sont conservées.
+
+    Args:
+        planning (dict[Tache, Intervalle] | Iterable[tuple[Tache, Intervalle]]): Le planning à résumer.
+        n (int): Le nombre de tâches à afficher.
+        critere (str): "duree" pour les tâches les plus longues, "fin" pour les tâches
+            terminant le plus tard.
+
+    Returns:
+        Table: La table Rich des n tâches, par critère décroissant.
+
+    Raises:
+        ValueError: Si le critère est inconnu.
+    """
+    if critere not in CRITERES:
+        raise ValueError(f"Critère {critere} inconnu, choisir parmi {', '.join(CRITERES)}!")
+    meilleures = heapq.nlargest(n, _couples(planning), key=CRITERES[critere])
+    return _table_planning(f"Planning (top {n} par {critere})", meilleures)
+
+
+def planning_to_gantt(
+    planning: dict[Tache, Intervalle] | Iterable[tuple[Tache, Intervalle]],
+    nb_fenetres: int = 20,
+    largeur_barre: int = 20,
+) -> Table:
+    """Convertit un planning en un diagramme de Gantt agrégé par fenêtres de temps.
+
+    Les dates sont relevées en un seul parcours du planning dans des tableaux compacts,
+    puis chaque tâche est répartie en temps constant sur les fenêtres qu'elle recouvre.
+
+    Args:
+        planning (dict[Tache, Intervalle] | Iterable[tuple[Tache, Intervalle]]): Le planning à agréger.
+        nb_fenetres (int): Le nombre de fenêtres de temps de même largeur.
+        largeur_barre (int): Le nombre de caractères de la barre la plus longue.
+
+    Returns:
+        Table: La table Rich avec, pour chaque fenêtre, le nombre de tâches démarrées,
+            le nombre de tâches actives et la concurrence moyenne.
+
+    Raises:
+        ValueError: Si le nombre de fenêtres n'est pas strictement positif.
+    """
+    if nb_fenetres < 1:
+        raise ValueError("Le nombre de fenêtres doit être strictement positif!")
+    debuts, fins = array("d"), array("d")
+    for _, intervalle in _couples(planning):
+        debuts.append(intervalle.debut)
+        fins.append(intervalle.fin)
+    horizon = max(fins, default=0.0)
+    largeur = horizon / nb_fenetres if horizon > 0 else 1.0
+    demarrees = [0] * nb_fenetres
+    actives = [0] * (nb_fenetres + 1)
+    pleines = [0] * (nb_fenetres + 1)
+    occupation = [0.0] * nb_fenetres
+    for debut, fin in zip(debuts, fins):
+        premiere = min(int(_position(debut, nb_fenetres, horizon)), nb_fenetres - 1)
+        derniere = ceil(_position(fin, nb_fenetres, horizon)) - 1
+        derniere = max(min(derniere, nb_fenetres - 1), premiere)
+        demarrees[premiere] += 1
+        actives[premiere] += 1
+        actives[derniere + 1] -= 1
+        if premiere == derniere:
+            occupation[premiere] += fin - debut
+        else:
+            occupation[premiere] += (premiere + 1) * largeur - debut
+            occupation[derniere] += fin - derniere * largeur
+            pleines[premiere + 1] += 1
+            pleines[derniere] -= 1
+    concurrences = list()
+    nb_actives, nb_pleines = 0, 0
+    for fenetre in range(nb_fenetres):
+        nb_actives += actives[fenetre]
+        nb_pleines += pleines[fenetre]
+        concurrence = occupation[fenetre] / largeur + nb_pleines
+        concurrences.append((nb_actives, concurrence))
+    maximum = max((concurrence for _, concurrence in concurrences), default=0.0)
+
+    resultat = Table(title="Gantt agrégé")
+    resultat.add_column("Début")
+    resultat.add_column("Fin")
+    resultat.add_column("Démarrées")
+    resultat.add_column("Actives")
+    resultat.add_column("Concurrence")
+    resultat.add_column("Charge")
+    if not debuts:
+        return resultat
+    for fenetre, (nb_actives, concurrence) in enumerate(concurrences):
+        barre = round(largeur_barre * concurrence / maximum) if maximum else 0
+        resultat.add_row(
+            f"{fenetre * largeur:.2f}",
+            f"{(fenetre + 1) * largeur:.2f}",
+            str(demarrees[fenetre]),
+            str(nb_actives),
+            f"{concurrence:.2f}",
+            "█" * barre,
+        )
+    return resultat
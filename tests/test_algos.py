@@ -7,7 +7,7 @@ Tests du module algos.py
 
 from pytest import raises  # type: ignore
 from pydantic import ValidationError  # type: ignore
-from exemple_supply_chain import CahierDesCharges, Tache, Intervalle, produit_planning
+from exemple_supply_chain import CahierDesCharges, Tache, Intervalle, produit_planning, iter_planning
 from exemple_supply_chain.algos import valide_tri_topologique, tri_topologique
 
 
@@ -114,3 +114,45 @@ def test_produit_planning_multiple_precedences():
         tache_d: Intervalle(debut=6.0, fin=11.0),
     }
     assert resultat == attendu
+
+
+def test_iter_planning_ordre_topologique():
+    """
+    Teste que le générateur émet les tâches dans un ordre topologique,
+    avec les mêmes intervalles que produit_planning.
+    """
+    tache_a = Tache(nom="A", prerequis=tuple(), duree=2.0)
+    tache_b = Tache(nom="B", prerequis=tuple([tache_a.nom]), duree=3.0)
+    tache_c = Tache(nom="C", prerequis=tuple([tache_a.nom]), duree=4.0)
+    tache_d = Tache(nom="D", prerequis=tuple([tache_b.nom, tache_c.nom]), duree=5.0)
+    cahier = CahierDesCharges(taches=tuple([tache_d, tache_c, tache_b, tache_a]))
+    resultat = list(iter_planning(cahier))
+    assert valide_tri_topologique([tache for tache, _ in resultat], cahier)
+    assert dict(resultat) == produit_planning(cahier)
+
+
+def test_iter_planning_cycle():
+    """
+    Teste le cas où le cahier des charges contient un cycle de dépendances.
+    Les tâches planifiables sont émises avant que l'exception ValueError ne soit levée.
+    """
+    tache_a = Tache(nom="A", prerequis=tuple(), duree=1)
+    tache_b = Tache(nom="B", prerequis=tuple("C"), duree=2)
+    tache_c = Tache(nom="C", prerequis=tuple("B"), duree=3)
+    cahier = CahierDesCharges(taches=tuple([tache_a, tache_b, tache_c]))
+    generateur = iter_planning(cahier)
+    assert next(generateur) == (tache_a, Intervalle(debut=0.0, fin=1.0))
+    with raises(ValueError):
+        next(generateur)
+
+
+def test_iter_planning_taches_en_double():
+    """
+    Teste le cas où deux tâches portent le même nom.
+    La fonction doit lever une exception ValueError, tout comme produit_planning.
+    """
+    cahier = CahierDesCharges(taches=(Tache(nom="A", duree=1), Tache(nom="A", duree=2)))
+    with raises(ValueError):
+        list(iter_planning(cahier))
+    with raises(ValueError):
+        produit_planning(cahier)
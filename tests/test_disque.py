@@ -0,0 +1,140 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Description.
+
+Tests du module disque.py
+"""
+
+import json
+import os
+from pytest import raises  # type: ignore
+from exemple_supply_chain import (
+    CahierDesCharges,
+    Tache,
+    produit_planning,
+    iter_planning,
+    lit_taches,
+    iter_planning_disque,
+    ecrit_planning,
+)
+
+
+def cahier_exemple() -> CahierDesCharges:
+    """Cahier des charges avec plusieurs chaînes de dépendances convergeant vers une seule tâche."""
+    tache_a = Tache(nom="A", prerequis=tuple(), duree=2.0)
+    tache_b = Tache(nom="B", prerequis=tuple(["A"]), duree=3.0)
+    tache_c = Tache(nom="C", prerequis=tuple(["A"]), duree=4)
+    tache_d = Tache(nom="D", prerequis=tuple(["C", "B"]), duree=5.0)
+    return CahierDesCharges(taches=tuple([tache_d, tache_b, tache_c, tache_a]))
+
+
+def test_lit_taches(tmp_path):
+    """Teste la lecture par blocs d'un cahier des charges sérialisé."""
+    cahier = cahier_exemple()
+    chemin = tmp_path / "cahier.json"
+    chemin.write_text(cahier.model_dump_json(indent=2))
+    assert tuple(lit_taches(str(chemin), taille_bloc=7)) == cahier.taches
+
+
+def test_lit_taches_tronque(tmp_path):
+    """Teste qu'un fichier tronqué lève une exception ValueError."""
+    chemin = tmp_path / "cahier.json"
+    chemin.write_text(cahier_exemple().model_dump_json()[:-20])
+    with raises(ValueError):
+        list(lit_taches(str(chemin)))
+
+
+def test_iter_planning_disque():
+    """Teste que le planning sur disque coïncide avec produit_planning, dans l'ordre des tâches."""
+    cahier = cahier_exemple()
+    resultat = list(iter_planning_disque(cahier.taches, taille_lot=3))
+    assert [tache for tache, _ in resultat] == list(cahier.taches)
+    assert dict(resultat) == produit_planning(cahier)
+
+
+def test_iter_planning_disque_cycle():
+    """Teste le cas où les tâches contiennent un cycle de dépendances."""
+    tache_a = Tache(nom="A", prerequis=tuple("B"), duree=1)
+    tache_b = Tache(nom="B", prerequis=tuple("A"), duree=2)
+    with raises(ValueError):
+        list(iter_planning_disque([tache_a, tache_b]))
+
+
+def test_iter_planning_disque_prerequis_invalide():
+    """Teste le cas où une tâche a un prérequis qui n'existe pas."""
+    tache_a = Tache(nom="A", prerequis=tuple("C"), duree=1)
+    with raises(ValueError):
+        list(iter_planning_disque([tache_a]))
+
+
+def test_ecrit_planning(tmp_path):
+    """Teste l'écriture d'un planning au format json lines."""
+    cahier = cahier_exemple()
+    chemin = tmp_path / "planning.jsonl"
+    ecrit_planning(produit_planning(cahier).items(), str(chemin))
+    lignes = [json.loads(ligne) for ligne in chemin.read_text().splitlines()]
+    assert lignes[0] == {"nom": "D", "debut": 6.0, "fin": 11.0}
+    assert len(lignes) == 4
+
+
+def test_iter_planning_disque_base_existante(tmp_path):
+    """Teste que deux planifications successives peuvent réutiliser la même base."""
+    cahier = cahier_exemple()
+    chemin_base = str(tmp_path / "planning.sqlite")
+    premier = list(iter_planning_disque(cahier.taches, chemin_base=chemin_base))
+    second = list(iter_planning_disque(cahier.taches, chemin_base=chemin_base))
+    assert premier == second
+    assert dict(second) == produit_planning(cahier)
+
+
+def test_lit_taches_objet_invalide(tmp_path):
+    """Teste qu'une tâche json invalide en milieu de fichier est signalée sans lire la suite."""
+    taches = tuple(Tache(nom=f"T{indice}", duree=1) for indice in range(200))
+    contenu = CahierDesCharges(taches=taches).model_dump_json(indent=2)
+    contenu = contenu.replace('"T1",', '"T1"', 1)
+    chemin = tmp_path / "cahier.json"
+    chemin.write_text(contenu)
+    with raises(ValueError, match="invalide"):
+        list(lit_taches(str(chemin), taille_bloc=64))
+
+
+def test_ecrit_planning_erreur(tmp_path):
+    """Teste qu'une erreur en cours d'écriture ne laisse aucun fichier partiel."""
+    tache_a = Tache(nom="A", prerequis=tuple(), duree=1)
+    tache_b = Tache(nom="B", prerequis=tuple("C"), duree=2)
+    tache_c = Tache(nom="C", prerequis=tuple("B"), duree=3)
+    chemin = tmp_path / "planning.jsonl"
+    with raises(ValueError):
+        cahier = CahierDesCharges(taches=tuple([tache_a, tache_b, tache_c]))
+        ecrit_planning(iter_planning(cahier), str(chemin))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_ecrit_planning_droits(tmp_path):
+    """Teste que le fichier écrit a les droits d'un fichier ouvert normalement."""
+    masque = os.umask(0o022)
+    try:
+        chemin = tmp_path / "planning.jsonl"
+        ecrit_planning(produit_planning(cahier_exemple()).items(), str(chemin))
+    finally:
+        os.umask(masque)
+    assert chemin.stat().st_mode & 0o777 == 0o644
+
+
+def test_lit_taches_separateurs_invalides(tmp_path):
+    """Teste que les virgules manquantes ou en trop entre tâches sont signalées."""
+    taches = tuple(Tache(nom=f"T{indice}", duree=1) for indice in range(3))
+    contenu = CahierDesCharges(taches=taches).model_dump_json()
+    chemin = tmp_path / "cahier.json"
+    for invalide in (contenu.replace("},{", "} {", 1), contenu.replace("},{", "},,{", 1)):
+        chemin.write_text(invalide)
+        with raises(ValueError, match="Tâche json invalide"):
+            list(lit_taches(str(chemin), taille_bloc=8))
+
+
+def test_lit_taches_liste_imbriquee(tmp_path):
+    """Teste qu'une liste de tâches imbriquée dans une autre clé est refusée."""
+    chemin = tmp_path / "cahier.json"
+    chemin.write_text('{"x": ' + cahier_exemple().model_dump_json() + "}")
+    with raises(ValueError, match="Aucune liste"):
+        list(lit_taches(str(chemin)))
@@ -86,3 +86,66 @@ def test_solve():
     assert resultat.stdout.decode("utf8") == resultat_attendu
     chemin_attendu = Path(".").resolve() / "demonstration.json"
     chemin_attendu.unlink()
+
+
+def test_solve_disque():
+    """Essai de la sous commande solve sur disque avec écriture du planning"""
+    run(["python", "-m", "exemple_supply_chain", "demo"])
+    run(
+        [
+            "python",
+            "-m",
+            "exemple_supply_chain",
+            "solve",
+            "demonstration.json",
+            "--disque",
+            "--sortie",
+            "planning.jsonl",
+        ]
+    )
+    chemin_attendu = Path(".").resolve() / "planning.jsonl"
+    resultat_attendu = (
+        '{"nom": "tâche 1", "debut": 0.0, "fin": 10.0}\n'
+        '{"nom": "tâche 2", "debut": 10.0, "fin": 30.0}\n'
+        '{"nom": "tâche 3", "debut": 30.0, "fin": 60.0}\n'
+    )
+    assert chemin_attendu.read_text() == resultat_attendu
+    chemin_attendu.unlink()
+    (Path(".").resolve() / "demonstration.json").unlink()
+
+
+def test_solve_options_exclusives():
+    """Essai de la sous commande solve avec des options d'affichage incompatibles"""
+    run(["python", "-m", "exemple_supply_chain", "demo"])
+    resultat = run(
+        [
+            "python",
+            "-m",
+            "exemple_supply_chain",
+            "solve",
+            "demonstration.json",
+            "--gantt",
+            "--top",
+            "5",
+        ],
+        capture_output=True,
+    )
+    assert resultat.returncode == 1
+    assert resultat.stdout.decode("utf8") == (
+        "Les options --sortie, --gantt, --top et --page sont exclusives!\n"
+    )
+    (Path(".").resolve() / "demonstration.json").unlink()
+
+
+def test_solve_disque_sans_affichage():
+    """Essai de la sous commande solve sur disque sans option d'affichage bornée"""
+    run(["python", "-m", "exemple_supply_chain", "demo"])
+    resultat = run(
+        ["python", "-m", "exemple_supply_chain", "solve", "demonstration.json", "--disque"],
+        capture_output=True,
+    )
+    assert resultat.returncode == 1
+    assert resultat.stdout.decode("utf8") == (
+        "L'option --disque nécessite --sortie, --gantt, --top ou --page!\n"
+    )
+    (Path(".").resolve() / "demonstration.json").unlink()
@@ -11,6 +11,8 @@ from exemple_supply_chain import (
     Tache,
     cahier_to_table,
     planning_to_table,
+    planning_top_table,
+    planning_to_gantt,
 )
 from rich.console import Console  # type: ignore
 
@@ -64,3 +66,107 @@ def test_planning_to_table_print():
         "└─────┴───────┴──────┴───────┴───────────┘\n"
     )
     assert output == expected_output
+
+
+def test_planning_to_table_page():
+    tache_a = Tache(nom="A", prerequis=tuple(), duree=2.0)
+    tache_b = Tache(nom="B", prerequis=tuple(["A"]), duree=3.0)
+    tache_c = Tache(nom="C", prerequis=tuple(["B"]), duree=4.0)
+    planning = iter(
+        [
+            (tache_a, Intervalle(debut=0.0, fin=2.0)),
+            (tache_b, Intervalle(debut=2.0, fin=5.0)),
+            (tache_c, Intervalle(debut=5.0, fin=9.0)),
+        ]
+    )
+
+    console = Console()
+    with console.capture() as capture:
+        console.print(planning_to_table(planning, page=2, taille_page=2))
+    output = capture.get()
+    expected_output = (
+        "            Planning (page 2)             \n"
+        "┏━━━━━┳━━━━━━━┳━━━━━━┳━━━━━━━┳━━━━━━━━━━━┓\n"
+        "┃ Nom ┃ Début ┃ Fin  ┃ Durée ┃ Prérequis ┃\n"
+        "┡━━━━━╇━━━━━━━╇━━━━━━╇━━━━━━━╇━━━━━━━━━━━┩\n"
+        "│ C   │ 5.00  │ 9.00 │ 4.00  │ B         │\n"
+        "└─────┴───────┴──────┴───────┴───────────┘\n"
+    )
+    assert output == expected_output
+
+
+def test_planning_top_table_print():
+    tache_a = Tache(nom="A", prerequis=tuple(), duree=2.0)
+    tache_b = Tache(nom="B", prerequis=tuple(["A"]), duree=4.0)
+    tache_c = Tache(nom="C", prerequis=tuple(["B"]), duree=3.0)
+    planning = {
+        tache_a: Intervalle(debut=0.0, fin=2.0),
+        tache_b: Intervalle(debut=2.0, fin=6.0),
+        tache_c: Intervalle(debut=6.0, fin=9.0),
+    }
+
+    console = Console()
+    with console.capture() as capture:
+        console.print(planning_top_table(planning, n=2))
+    output = capture.get()
+    expected_output = (
+        "        Planning (top 2 par duree)        \n"
+        "┏━━━━━┳━━━━━━━┳━━━━━━┳━━━━━━━┳━━━━━━━━━━━┓\n"
+        "┃ Nom ┃ Début ┃ Fin  ┃ Durée ┃ Prérequis ┃\n"
+        "┡━━━━━╇━━━━━━━╇━━━━━━╇━━━━━━━╇━━━━━━━━━━━┩\n"
+        "│ B   │ 2.00  │ 6.00 │ 4.00  │ A         │\n"
+        "│ C   │ 6.00  │ 9.00 │ 3.00  │ B         │\n"
+        "└─────┴───────┴──────┴───────┴───────────┘\n"
+    )
+    assert output == expected_output
+
+
+def test_planning_to_gantt_print():
+    tache_a = Tache(nom="A", prerequis=tuple(), duree=2.0)
+    tache_b = Tache(nom="B", prerequis=tuple(), duree=4.0)
+    tache_c = Tache(nom="C", prerequis=tuple(["A"]), duree=1.0)
+    planning = {
+        tache_a: Intervalle(debut=0.0, fin=2.0),
+        tache_b: Intervalle(debut=0.0, fin=4.0),
+        tache_c: Intervalle(debut=2.0, fin=3.0),
+    }
+
+    console = Console()
+    with console.capture() as capture:
+        console.print(planning_to_gantt(planning, nb_fenetres=2, largeur_barre=4))
+    output = capture.get()
+    expected_output = (
+        "                        Gantt agrégé                         \n"
+        "┏━━━━━━━┳━━━━━━┳━━━━━━━━━━━┳━━━━━━━━━┳━━━━━━━━━━━━━┳━━━━━━━━┓\n"
+        "┃ Début ┃ Fin  ┃ Démarrées ┃ Actives ┃ Concurrence ┃ Charge ┃\n"
+        "┡━━━━━━━╇━━━━━━╇━━━━━━━━━━━╇━━━━━━━━━╇━━━━━━━━━━━━━╇━━━━━━━━┩\n"
+        "│ 0.00  │ 2.00 │ 2         │ 2       │ 2.00        │ ████   │\n"
+        "│ 2.00  │ 4.00 │ 1         │ 2       │ 1.50        │ ███    │\n"
+        "└───────┴──────┴───────────┴─────────┴─────────────┴────────┘\n"
+    )
+    assert output == expected_output
+
+
+def test_planning_to_gantt_frontiere_flottante():
+    tache_a = Tache(nom="A", prerequis=tuple(), duree=0.1)
+    tache_b = Tache(nom="B", prerequis=tuple(["A"]), duree=0.2)
+    planning = {
+        tache_a: Intervalle(debut=0.0, fin=0.1),
+        tache_b: Intervalle(debut=0.1, fin=0.1 + 0.2),
+    }
+
+    console = Console()
+    with console.capture() as capture:
+        console.print(planning_to_gantt(planning, nb_fenetres=3, largeur_barre=4))
+    output = capture.get()
+    expected_output = (
+        "                        Gantt agrégé                         \n"
+        "┏━━━━━━━┳━━━━━━┳━━━━━━━━━━━┳━━━━━━━━━┳━━━━━━━━━━━━━┳━━━━━━━━┓\n"
+        "┃ Début ┃ Fin  ┃ Démarrées ┃ Actives ┃ Concurrence ┃ Charge ┃\n"
+        "┡━━━━━━━╇━━━━━━╇━━━━━━━━━━━╇━━━━━━━━━╇━━━━━━━━━━━━━╇━━━━━━━━┩\n"
+        "│ 0.00  │ 0.10 │ 1         │ 1       │ 1.00        │ ████   │\n"
+        "│ 0.10  │ 0.20 │ 1         │ 1       │ 1.00        │ ████   │\n"
+        "│ 0.20  │ 0.30 │ 0         │ 1       │ 1.00        │ ████   │\n"
+        "└───────┴──────┴───────────┴─────────┴─────────────┴────────┘\n"
+    )
+    assert output == expected_output